@@ -5,41 +5,208 @@ A comprehensive tool for analyzing A/B test proposals, providing statistical
 validation, hypothesis scoring, and design recommendations.
 """
 
-import json
 import logging
-from typing import Dict, Any, List
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+import os
+from typing import List
 
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing_extensions import TypedDict
+
+from core import __version__
+from core.cache import cache_get, cache_set, code_fingerprint, make_cache_key
 from core.models import TestProposal, AnalysisResult, ReadinessStatus
 from core.statistical import analyze_statistical_validity
 from core.hypothesis import score_hypothesis
 from core.design import validate_design
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging (WARNING by default; set LOG_LEVEL=INFO or DEBUG for more detail)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
 logger = logging.getLogger(__name__)
 
+# Static CORS headers for the allow-all policy used by the Opal integration
+_CORS_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+              b"Access-Control-Request-Private-Network"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+]
+_CORS_SIMPLE_HEADERS = [
+    (b"access-control-allow-credentials", b"true"),
+]
+
+
+class LiteCORS:
+    """
+    Pure ASGI CORS middleware for a fixed allow-all policy.
+    
+    Equivalent to CORSMiddleware with allow_origins, allow_methods and
+    allow_headers set to "*" and allow_credentials=True, but scans the raw
+    ASGI headers once instead of building Headers/MutableHeaders objects on
+    every request. The request origin is echoed back, since browsers reject
+    a wildcard origin on credentialed requests.
+    """
+    
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        origin = None
+        requested_method = None
+        requested_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                requested_method = value
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+        
+        # Answer preflight requests directly without touching the app
+        if origin is not None and scope["method"] == "OPTIONS" and requested_method is not None:
+            headers = [(b"access-control-allow-origin", origin), *_CORS_PREFLIGHT_HEADERS]
+            if requested_headers is not None:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+        
+        if origin is None:
+            cors_headers = []
+        else:
+            cors_headers = [(b"access-control-allow-origin", origin), *_CORS_SIMPLE_HEADERS]
+        
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Responses vary by Origin even without one, so shared caches never
+                # replay a header-less response to cross-origin callers; merge any
+                # existing Vary values into a single header
+                headers = []
+                vary = []
+                for name, value in message.get("headers", ()):
+                    if name.lower() == b"vary":
+                        vary.append(value)
+                    else:
+                        headers.append((name, value))
+                vary.append(b"Origin")
+                message["headers"] = [*headers, *cors_headers, (b"vary", b", ".join(vary))]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Test Readiness Analyzer",
     description="Analyzes A/B test proposals for statistical validity, hypothesis quality, and design best practices",
-    version="1.0.0"
+    version=__version__
 )
 
 # Add CORS middleware for Optimizely integration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(LiteCORS)  # Allows all origins; configure appropriately for production
+
+
+# Static payloads are serialized once at import time
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "version": __version__
+})
+
+_DISCOVERY_BYTES = orjson.dumps({
+    "functions": [
+        {
+            "name": "test_readiness_analyzer",
+            "description": "Analyzes A/B test proposals for statistical validity, hypothesis quality, and design best practices. Use this when a user wants to evaluate if their experiment is ready to launch.",
+            "parameters": [
+                {
+                    "name": "hypothesis",
+                    "type": "string",
+                    "description": "The test hypothesis describing what you want to test and why",
+                    "required": True
+                },
+                {
+                    "name": "baseline_conversion_rate",
+                    "type": "number",
+                    "description": "Current baseline conversion rate (0-1)",
+                    "required": True
+                },
+                {
+                    "name": "minimum_detectable_effect",
+                    "type": "number",
+                    "description": "Minimum detectable effect you want to measure (0-1)",
+                    "required": True
+                },
+                {
+                    "name": "daily_traffic",
+                    "type": "integer",
+                    "description": "Daily traffic volume for the test",
+                    "required": True
+                },
+                {
+                    "name": "number_of_variations",
+                    "type": "integer",
+                    "description": "Number of test variations (including control)",
+                    "required": False
+                },
+                {
+                    "name": "primary_metric",
+                    "type": "string",
+                    "description": "Primary success metric for the test",
+                    "required": True
+                },
+                {
+                    "name": "secondary_metrics",
+                    "type": "array",
+                    "description": "Additional metrics to track during the test",
+                    "required": False
+                },
+                {
+                    "name": "test_start_date",
+                    "type": "string",
+                    "description": "Planned test start date (ISO format)",
+                    "required": False
+                }
+            ],
+            "endpoint": "/analyze",
+            "http_method": "POST",
+            "auth_requirements": []
+        }
+    ]
+})
+
+
+# Headline recommendation for each readiness status
+_STATUS_RECOMMENDATIONS = {
+    ReadinessStatus.READY: "✅ Test is ready to launch! All criteria met.",
+    ReadinessStatus.NEEDS_WORK: "⚠️ Test needs some improvements before launch.",
+    ReadinessStatus.NOT_READY: "❌ Test is not ready. Address critical issues before proceeding."
+}
+
+
+class OpalToolRequest(TypedDict):
+    """Opal tool call envelope; the tool arguments arrive under "parameters"."""
+    parameters: TestProposal
+
+
+# Built once so each request validates the raw JSON body in a single pass
+_OPAL_REQUEST_ADAPTER = TypeAdapter(OpalToolRequest)
+
+# Cached analyses are only reused while the analyzers and this module are unchanged
+_ANALYSIS_FINGERPRINT = code_fingerprint(__file__)
 
 
 @app.get("/health")
-async def health_check() -> Dict[str, str]:
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring and deployment verification.
     
@@ -47,14 +214,11 @@ async def health_check() -> Dict[str, str]:
         Status and version information
     """
     logger.info("Health check requested")
-    return {
-        "status": "healthy",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/discovery")
-async def discovery() -> Dict[str, Any]:
+async def discovery() -> Response:
     """
     Optimizely Opal tool discovery endpoint.
     
@@ -62,72 +226,11 @@ async def discovery() -> Dict[str, Any]:
         Tool manifest for Optimizely Opal integration
     """
     logger.info("Discovery endpoint requested")
-    
-    return {
-        "functions": [
-            {
-                "name": "test_readiness_analyzer",
-                "description": "Analyzes A/B test proposals for statistical validity, hypothesis quality, and design best practices. Use this when a user wants to evaluate if their experiment is ready to launch.",
-                "parameters": [
-                    {
-                        "name": "hypothesis",
-                        "type": "string",
-                        "description": "The test hypothesis describing what you want to test and why",
-                        "required": True
-                    },
-                    {
-                        "name": "baseline_conversion_rate",
-                        "type": "number",
-                        "description": "Current baseline conversion rate (0-1)",
-                        "required": True
-                    },
-                    {
-                        "name": "minimum_detectable_effect",
-                        "type": "number",
-                        "description": "Minimum detectable effect you want to measure (0-1)",
-                        "required": True
-                    },
-                    {
-                        "name": "daily_traffic",
-                        "type": "integer",
-                        "description": "Daily traffic volume for the test",
-                        "required": True
-                    },
-                    {
-                        "name": "number_of_variations",
-                        "type": "integer",
-                        "description": "Number of test variations (including control)",
-                        "required": False
-                    },
-                    {
-                        "name": "primary_metric",
-                        "type": "string",
-                        "description": "Primary success metric for the test",
-                        "required": True
-                    },
-                    {
-                        "name": "secondary_metrics",
-                        "type": "array",
-                        "description": "Additional metrics to track during the test",
-                        "required": False
-                    },
-                    {
-                        "name": "test_start_date",
-                        "type": "string",
-                        "description": "Planned test start date (ISO format)",
-                        "required": False
-                    }
-                ],
-                "endpoint": "/analyze",
-                "http_method": "POST",
-                "auth_requirements": []
-            }
-        ]
-    }
-
-
-@app.post("/analyze")
-async def analyze_test_proposal(request: Request) -> AnalysisResult:
+    return Response(content=_DISCOVERY_BYTES, media_type="application/json")
+
+
+@app.post("/analyze", response_model=None, responses={200: {"model": AnalysisResult}})
+async def analyze_test_proposal(request: Request) -> Response:
     """
     Analyze a test proposal for readiness.
     
@@ -141,54 +244,88 @@ async def analyze_test_proposal(request: Request) -> AnalysisResult:
         HTTPException: If analysis fails
     """
     try:
-        body = await request.json()
-        logger.info(f"Raw request body received: {json.dumps(body, indent=2)}")
-        proposal = TestProposal(**body["parameters"])
-        logger.info(f"Analyzing test proposal: {proposal.hypothesis[:50]}...")
+        body = await request.body()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw request body received: %s", body.decode(errors="replace"))
+        proposal = _OPAL_REQUEST_ADAPTER.validate_json(body)["parameters"]
+        logger.info("Analyzing test proposal: %.50s...", proposal.hypothesis)
         
-        # Perform statistical analysis
-        logger.info("Performing statistical analysis...")
-        statistical_analysis = analyze_statistical_validity(proposal)
-        
-        # Score hypothesis quality
-        logger.info("Scoring hypothesis quality...")
-        hypothesis_analysis = score_hypothesis(proposal)
-        
-        # Validate test design
-        logger.info("Validating test design...")
-        design_analysis = validate_design(proposal, statistical_analysis.required_sample_size)
-        
-        # Determine readiness status
-        readiness_status = determine_readiness_status(
-            hypothesis_analysis.overall_score,
-            statistical_analysis.estimated_duration_days,
-            design_analysis
-        )
-        
-        # Generate overall recommendations
-        overall_recommendations = generate_overall_recommendations(
-            readiness_status,
-            statistical_analysis,
-            hypothesis_analysis,
-            design_analysis
-        )
-        
-        result = AnalysisResult(
-            readiness_status=readiness_status,
-            statistical_analysis=statistical_analysis,
-            hypothesis_analysis=hypothesis_analysis,
-            design_analysis=design_analysis,
-            overall_recommendations=overall_recommendations
-        )
-        
-        logger.info(f"Analysis complete. Status: {readiness_status}")
-        return result
+        # The analyzers take microseconds, so the whole pipeline, including the
+        # blocking disk cache, runs in a single threadpool hop
+        result_body = await run_in_threadpool(run_analysis, proposal)
+        return Response(content=result_body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Analysis failed: {str(e)}")
+        logger.error("Analysis failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
+def run_analysis(proposal: TestProposal) -> bytes:
+    """
+    Run the full analysis for a proposal, serving repeats from the disk cache.
+    
+    Blocks on cache I/O, so async callers run it in a worker thread.
+    
+    Args:
+        proposal: Validated TestProposal
+    
+    Returns:
+        JSON-encoded AnalysisResult
+    """
+    # Identical proposals always produce identical results, serve repeats from disk
+    cache_key = make_cache_key(
+        "analysis", proposal.model_dump_json().encode(), _ANALYSIS_FINGERPRINT
+    )
+    cached_body = cache_get(cache_key)
+    if cached_body is not None:
+        logger.info("Analysis served from cache")
+        return cached_body
+    
+    # Perform statistical analysis
+    logger.debug("Performing statistical analysis...")
+    statistical_analysis = analyze_statistical_validity(proposal)
+    
+    # Score hypothesis quality
+    logger.debug("Scoring hypothesis quality...")
+    hypothesis_analysis = score_hypothesis(proposal)
+    
+    # Validate test design (depends on the required sample size)
+    logger.debug("Validating test design...")
+    design_analysis = validate_design(proposal, statistical_analysis.required_sample_size)
+    
+    # Determine readiness status
+    readiness_status = determine_readiness_status(
+        hypothesis_analysis.overall_score,
+        statistical_analysis.estimated_duration_days,
+        design_analysis
+    )
+    
+    # Generate overall recommendations
+    overall_recommendations = generate_overall_recommendations(
+        readiness_status,
+        statistical_analysis,
+        hypothesis_analysis,
+        design_analysis
+    )
+    
+    # Sub-models were built by the analyzers, so skip re-validating them
+    result = AnalysisResult.model_construct(
+        readiness_status=readiness_status.value,
+        statistical_analysis=statistical_analysis,
+        hypothesis_analysis=hypothesis_analysis,
+        design_analysis=design_analysis,
+        overall_recommendations=overall_recommendations
+    )
+    
+    logger.info("Analysis complete. Status: %s", readiness_status.value)
+    
+    # Encode with pydantic-core directly; the result is built internally and
+    # needs no outbound response_model validation (schema is kept via responses=)
+    result_body = result.model_dump_json().encode()
+    cache_set(cache_key, result_body)
+    return result_body
+
+
 def determine_readiness_status(
     hypothesis_score: float,
     duration_days: int,
@@ -205,17 +342,14 @@ def determine_readiness_status(
     Returns:
         ReadinessStatus enum value
     """
-    # Check for critical design flaws
-    critical_warnings = [
-        design_analysis.variation_count_warning,
-        design_analysis.traffic_allocation_warning
-    ]
-    has_critical_warnings = any(warning for warning in critical_warnings if warning)
+    # Any critical design flaw rules the test out
+    if design_analysis.variation_count_warning or design_analysis.traffic_allocation_warning:
+        return ReadinessStatus.NOT_READY
     
     # Determine status based on criteria
-    if hypothesis_score >= 7 and duration_days <= 30 and not has_critical_warnings:
+    if hypothesis_score >= 7 and duration_days <= 30:
         return ReadinessStatus.READY
-    elif hypothesis_score >= 5 and duration_days <= 60 and not has_critical_warnings:
+    elif hypothesis_score >= 5 and duration_days <= 60:
         return ReadinessStatus.NEEDS_WORK
     else:
         return ReadinessStatus.NOT_READY
@@ -239,15 +373,8 @@ def generate_overall_recommendations(
     Returns:
         List of overall recommendations
     """
-    recommendations = []
-    
     # Status-specific recommendations
-    if readiness_status == ReadinessStatus.READY:
-        recommendations.append("✅ Test is ready to launch! All criteria met.")
-    elif readiness_status == ReadinessStatus.NEEDS_WORK:
-        recommendations.append("⚠️ Test needs some improvements before launch.")
-    else:
-        recommendations.append("❌ Test is not ready. Address critical issues before proceeding.")
+    recommendations = [_STATUS_RECOMMENDATIONS[readiness_status]]
     
     # Statistical recommendations
     if statistical_analysis.estimated_duration_days > 30:
@@ -5,7 +5,7 @@ This module contains the core functionality for analyzing A/B test proposals,
 including statistical validation, hypothesis scoring, and design recommendations.
 """
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
 
 
 
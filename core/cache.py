@@ -0,0 +1,116 @@
+"""
+Persistent result cache for the Test Readiness Analyzer.
+
+Analysis is fully deterministic given its inputs and the code that runs it,
+so results are memoized on disk keyed by a hash of the canonical input and
+of the analysis source files. The cache is shared by all worker processes
+on a host and survives restarts.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import diskcache
+
+from . import __version__
+
+logger = logging.getLogger(__name__)
+
+# Cache location, size limit (oldest entries are evicted beyond the limit)
+# and entry lifetime in seconds
+CACHE_DIRECTORY = os.getenv("ANALYSIS_CACHE_DIR", ".analysis_cache")
+CACHE_SIZE_LIMIT = 100 * 1024 * 1024
+CACHE_TTL_SECONDS = int(os.getenv("ANALYSIS_CACHE_TTL", str(24 * 60 * 60)))
+
+# Errors that mean the cache is unusable (locked, corrupt, full or read-only disk)
+CACHE_ERRORS = (OSError, sqlite3.Error, diskcache.Timeout)
+
+# Source files of this package; any edit to them changes cache keys
+_PACKAGE_SOURCES = tuple(sorted(Path(__file__).resolve().parent.glob("*.py")))
+
+
+@lru_cache(maxsize=None)
+def get_cache() -> diskcache.Cache:
+    """
+    Open the on-disk cache, once per process.
+
+    Returns:
+        Shared diskcache.Cache instance
+    """
+    return diskcache.Cache(CACHE_DIRECTORY, size_limit=CACHE_SIZE_LIMIT)
+
+
+@lru_cache(maxsize=None)
+def code_fingerprint(*extra_sources: str) -> str:
+    """
+    Hash the package version and the source code that produces cached results.
+
+    Covers every module in this package plus any extra files the caller's
+    results depend on (e.g. the application module), so entries written by
+    different code are never served, even without a version bump.
+
+    Args:
+        extra_sources: Paths of additional source files to include
+
+    Returns:
+        Hex digest identifying the running code
+    """
+    digest = hashlib.sha256(__version__.encode())
+    for path in (*_PACKAGE_SOURCES, *map(Path, extra_sources)):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def make_cache_key(namespace: str, payload: bytes, fingerprint: str) -> str:
+    """
+    Build a cache key from a namespace, canonical input bytes and code fingerprint.
+
+    Args:
+        namespace: Kind of cached value (e.g. "analysis")
+        payload: Canonical serialized input
+        fingerprint: code_fingerprint() of the code computing the value
+
+    Returns:
+        Cache key string
+    """
+    return f"{namespace}:{fingerprint}:{hashlib.sha256(payload).hexdigest()}"
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    """
+    Look up a cached value, treating any cache failure as a miss.
+
+    Blocks on disk I/O, so call it from a worker thread in async code.
+
+    Args:
+        key: Cache key from make_cache_key
+
+    Returns:
+        Cached bytes, or None if absent or the cache is unavailable
+    """
+    try:
+        return get_cache().get(key)
+    except CACHE_ERRORS as e:
+        logger.warning("Cache read failed: %s", e)
+        return None
+
+
+def cache_set(key: str, value: bytes) -> None:
+    """
+    Store a value with the configured TTL, skipping the store on cache failure.
+
+    Blocks on disk I/O, so call it from a worker thread in async code.
+
+    Args:
+        key: Cache key from make_cache_key
+        value: Bytes to cache
+    """
+    try:
+        get_cache().set(key, value, expire=CACHE_TTL_SECONDS)
+    except CACHE_ERRORS as e:
+        logger.warning("Cache write failed: %s", e)
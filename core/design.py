@@ -5,11 +5,30 @@ This module validates test design elements including variation count,
 traffic allocation, metric selection, and provides specific recommendations.
 """
 
-from typing import List, Optional
+import re
+from typing import List, Optional, Sequence
 
 from .models import TestProposal, DesignAnalysis
 
 
+# High-variance metrics that may need larger sample sizes
+HIGH_VARIANCE_METRICS = (
+    'revenue', 'average order value', 'aov', 'lifetime value', 'ltv',
+    'time on site', 'session duration', 'bounce rate'
+)
+
+# Matches any high-variance metric as a substring of a lowercased metric name
+HIGH_VARIANCE_RE = re.compile("|".join(re.escape(metric) for metric in HIGH_VARIANCE_METRICS))
+
+# General best practices appended to every set of design recommendations
+GENERAL_BEST_PRACTICES = (
+    "Ensure proper randomization and avoid selection bias in traffic allocation.",
+    "Set up proper tracking and analytics before test launch.",
+    "Define success criteria and stopping rules before starting the test.",
+    "Plan for post-test analysis and implementation of winning variations."
+)
+
+
 def validate_variation_count(number_of_variations: int) -> Optional[str]:
     """
     Validate the number of test variations.
@@ -74,7 +93,7 @@ def validate_traffic_allocation(
     return None
 
 
-def validate_metrics(primary_metric: str, secondary_metrics: Optional[List[str]]) -> List[str]:
+def validate_metrics(primary_metric: str, secondary_metrics: Optional[Sequence[str]]) -> List[str]:
     """
     Validate metric selection and provide warnings.
     
@@ -90,13 +109,7 @@ def validate_metrics(primary_metric: str, secondary_metrics: Optional[List[str]]
     # Check primary metric
     primary_lower = primary_metric.lower()
     
-    # High-variance metrics that may need larger sample sizes
-    high_variance_metrics = [
-        'revenue', 'average order value', 'aov', 'lifetime value', 'ltv',
-        'time on site', 'session duration', 'bounce rate'
-    ]
-    
-    if any(metric in primary_lower for metric in high_variance_metrics):
+    if HIGH_VARIANCE_RE.search(primary_lower) is not None:
         warnings.append(
             f"Primary metric '{primary_metric}' has high variance. "
             "Consider increasing sample size or using a more stable metric."
@@ -112,9 +125,7 @@ def validate_metrics(primary_metric: str, secondary_metrics: Optional[List[str]]
     # Check secondary metrics
     if secondary_metrics:
         for metric in secondary_metrics:
-            metric_lower = metric.lower()
-            
-            if any(high_var_metric in metric_lower for high_var_metric in high_variance_metrics):
+            if HIGH_VARIANCE_RE.search(metric.lower()) is not None:
                 warnings.append(
                     f"Secondary metric '{metric}' has high variance. "
                     "Monitor closely and consider statistical significance carefully."
@@ -205,14 +216,7 @@ def generate_recommendations(
         )
     
     # Add general best practices
-    recommendations.extend([
-        "Ensure proper randomization and avoid selection bias in traffic allocation.",
-        "Set up proper tracking and analytics before test launch.",
-        "Define success criteria and stopping rules before starting the test.",
-        "Plan for post-test analysis and implementation of winning variations."
-    ])
-    
-    return recommendations
+    return [*recommendations, *GENERAL_BEST_PRACTICES]
 
 
 def validate_design(proposal: TestProposal, required_sample_size: int) -> DesignAnalysis:
@@ -5,18 +5,146 @@ This module evaluates hypothesis quality based on specificity, measurability,
 directionality, and rationale, providing actionable feedback for improvement.
 """
 
-import re
-from typing import List, Tuple
+from functools import lru_cache
+from typing import AbstractSet, Dict, FrozenSet, List, Tuple
+
+import ahocorasick
 
 from .models import TestProposal, HypothesisScore
 
 
-def check_specificity(hypothesis: str) -> Tuple[float, List[str]]:
+# Keyword vocabularies used to score each hypothesis dimension
+UI_ELEMENTS = (
+    'button', 'form', 'header', 'footer', 'navigation', 'menu', 'link',
+    'image', 'text', 'title', 'subtitle', 'call-to-action', 'cta',
+    'checkout', 'cart', 'product', 'pricing', 'signup', 'login'
+)
+
+ACTION_WORDS = (
+    'click', 'submit', 'purchase', 'sign up', 'register', 'download',
+    'subscribe', 'complete', 'finish', 'proceed', 'continue'
+)
+
+METRIC_WORDS = (
+    'conversion', 'click-through', 'engagement', 'time', 'revenue',
+    'signups', 'purchases', 'downloads', 'registrations'
+)
+
+QUANTITATIVE_METRICS = (
+    'rate', 'percentage', '%', 'ratio', 'count', 'number', 'total',
+    'average', 'mean', 'median', 'conversion rate', 'click rate',
+    'engagement rate', 'bounce rate', 'completion rate'
+)
+
+MEASUREMENT_TERMS = (
+    'track', 'measure', 'analytics', 'data', 'metric', 'kpi',
+    'conversion tracking', 'event tracking', 'funnel'
+)
+
+POSITIVE_DIRECTION = (
+    'increase', 'improve', 'boost', 'enhance', 'raise', 'lift',
+    'higher', 'more', 'better', 'faster', 'easier'
+)
+
+NEGATIVE_DIRECTION = (
+    'decrease', 'reduce', 'lower', 'less', 'fewer', 'minimize'
+)
+
+REASONING_WORDS = (
+    'because', 'since', 'due to', 'as a result', 'therefore',
+    'given that', 'considering', 'based on', 'according to'
+)
+
+EVIDENCE_WORDS = (
+    'data', 'research', 'study', 'analysis', 'findings', 'results',
+    'evidence', 'insights', 'observations', 'feedback', 'user behavior'
+)
+
+VAGUE_WORDS = (
+    'improve', 'better', 'optimize', 'enhance', 'good', 'bad',
+    'nice', 'great', 'awesome', 'terrible', 'amazing', 'wonderful'
+)
+
+
+# Feedback items that generate_improved_hypothesis turns into suggestions
+NO_UI_ELEMENTS = "✗ No specific UI elements mentioned"
+NO_USER_ACTIONS = "✗ No specific user actions mentioned"
+NO_QUANTITATIVE_METRICS = "✗ No quantitative metrics mentioned"
+NO_DIRECTION = "✗ No clear directional prediction"
+NO_REASONING = "✗ No clear reasoning provided"
+
+
+# Category name -> vocabulary
+KEYWORD_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    'ui_elements': UI_ELEMENTS,
+    'action_words': ACTION_WORDS,
+    'metric_words': METRIC_WORDS,
+    'quantitative_metrics': QUANTITATIVE_METRICS,
+    'measurement_terms': MEASUREMENT_TERMS,
+    'positive_direction': POSITIVE_DIRECTION,
+    'negative_direction': NEGATIVE_DIRECTION,
+    'reasoning_words': REASONING_WORDS,
+    'evidence_words': EVIDENCE_WORDS,
+    'vague_words': VAGUE_WORDS,
+}
+
+
+def _build_keyword_automaton():
+    """
+    Build one Aho-Corasick automaton covering every keyword category.
+    
+    Terms shared between categories (e.g. 'data', 'improve') are added once
+    and tagged with all of their categories.
+    
+    Returns:
+        Automaton whose values are (term, categories) tuples
+    """
+    categories_by_term: Dict[str, List[str]] = {}
+    for category, terms in KEYWORD_CATEGORIES.items():
+        for term in terms:
+            categories_by_term.setdefault(term, []).append(category)
+    
+    automaton = ahocorasick.Automaton()
+    for term, categories in categories_by_term.items():
+        automaton.add_word(term, (term, tuple(categories)))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Distinct vocabulary terms found in a hypothesis, keyed by category
+KeywordHits = Dict[str, FrozenSet[str]]
+
+
+def extract_keyword_hits(hypothesis_lower: str) -> KeywordHits:
+    """
+    Find the vocabulary terms present in a hypothesis for every category.
+    
+    The hits are computed once per hypothesis and shared by all the check_*
+    functions, which then only need set sizes and membership tests. The text
+    is scanned exactly once for all categories.
+    
+    Args:
+        hypothesis_lower: The lowercased hypothesis text
+    
+    Returns:
+        Mapping of category name to the distinct terms found
+    """
+    found: Dict[str, set] = {category: set() for category in KEYWORD_CATEGORIES}
+    for _, (term, categories) in KEYWORD_AUTOMATON.iter(hypothesis_lower):
+        for category in categories:
+            found[category].add(term)
+    
+    return {category: frozenset(terms) for category, terms in found.items()}
+
+
+def check_specificity(hits: KeywordHits) -> Tuple[float, List[str]]:
     """
     Check hypothesis specificity - identifies what is changing.
     
     Args:
-        hypothesis: The hypothesis text
+        hits: Keyword hits from extract_keyword_hits
     
     Returns:
         Tuple of (score, feedback)
@@ -24,43 +152,24 @@ def check_specificity(hypothesis: str) -> Tuple[float, List[str]]:
     score = 0.0
     feedback = []
     
-    # Check for specific elements
-    hypothesis_lower = hypothesis.lower()
-    
     # Look for specific UI elements
-    ui_elements = [
-        'button', 'form', 'header', 'footer', 'navigation', 'menu', 'link',
-        'image', 'text', 'title', 'subtitle', 'call-to-action', 'cta',
-        'checkout', 'cart', 'product', 'pricing', 'signup', 'login'
-    ]
-    
-    ui_found = sum(1 for element in ui_elements if element in hypothesis_lower)
+    ui_found = len(hits['ui_elements'])
     if ui_found > 0:
         score += 1.0
         feedback.append(f"✓ Identifies specific UI elements ({ui_found} found)")
     else:
-        feedback.append("✗ No specific UI elements mentioned")
+        feedback.append(NO_UI_ELEMENTS)
     
     # Look for specific actions
-    action_words = [
-        'click', 'submit', 'purchase', 'sign up', 'register', 'download',
-        'subscribe', 'complete', 'finish', 'proceed', 'continue'
-    ]
-    
-    actions_found = sum(1 for action in action_words if action in hypothesis_lower)
+    actions_found = len(hits['action_words'])
     if actions_found > 0:
         score += 1.0
         feedback.append(f"✓ Identifies specific user actions ({actions_found} found)")
     else:
-        feedback.append("✗ No specific user actions mentioned")
+        feedback.append(NO_USER_ACTIONS)
     
     # Look for specific metrics or outcomes
-    metric_words = [
-        'conversion', 'click-through', 'engagement', 'time', 'revenue',
-        'signups', 'purchases', 'downloads', 'registrations'
-    ]
-    
-    metrics_found = sum(1 for metric in metric_words if metric in hypothesis_lower)
+    metrics_found = len(hits['metric_words'])
     if metrics_found > 0:
         score += 0.5
         feedback.append(f"✓ Mentions specific metrics ({metrics_found} found)")
@@ -70,12 +179,12 @@ def check_specificity(hypothesis: str) -> Tuple[float, List[str]]:
     return min(score, 2.5), feedback
 
 
-def check_measurability(hypothesis: str) -> Tuple[float, List[str]]:
+def check_measurability(hits: KeywordHits) -> Tuple[float, List[str]]:
     """
     Check hypothesis measurability - mentions clear metrics.
     
     Args:
-        hypothesis: The hypothesis text
+        hits: Keyword hits from extract_keyword_hits
     
     Returns:
         Tuple of (score, feedback)
@@ -83,29 +192,16 @@ def check_measurability(hypothesis: str) -> Tuple[float, List[str]]:
     score = 0.0
     feedback = []
     
-    hypothesis_lower = hypothesis.lower()
-    
     # Look for quantitative metrics
-    quantitative_metrics = [
-        'rate', 'percentage', '%', 'ratio', 'count', 'number', 'total',
-        'average', 'mean', 'median', 'conversion rate', 'click rate',
-        'engagement rate', 'bounce rate', 'completion rate'
-    ]
-    
-    quant_found = sum(1 for metric in quantitative_metrics if metric in hypothesis_lower)
+    quant_found = len(hits['quantitative_metrics'])
     if quant_found > 0:
         score += 1.5
         feedback.append(f"✓ Uses quantitative metrics ({quant_found} found)")
     else:
-        feedback.append("✗ No quantitative metrics mentioned")
+        feedback.append(NO_QUANTITATIVE_METRICS)
     
     # Look for specific measurement tools or methods
-    measurement_terms = [
-        'track', 'measure', 'analytics', 'data', 'metric', 'kpi',
-        'conversion tracking', 'event tracking', 'funnel'
-    ]
-    
-    measurement_found = sum(1 for term in measurement_terms if term in hypothesis_lower)
+    measurement_found = len(hits['measurement_terms'])
     if measurement_found > 0:
         score += 1.0
         feedback.append(f"✓ Mentions measurement approach ({measurement_found} found)")
@@ -115,12 +211,12 @@ def check_measurability(hypothesis: str) -> Tuple[float, List[str]]:
     return min(score, 2.5), feedback
 
 
-def check_directionality(hypothesis: str) -> Tuple[float, List[str]]:
+def check_directionality(hits: KeywordHits) -> Tuple[float, List[str]]:
     """
     Check hypothesis directionality - predicts outcome direction.
     
     Args:
-        hypothesis: The hypothesis text
+        hits: Keyword hits from extract_keyword_hits
     
     Returns:
         Tuple of (score, feedback)
@@ -128,20 +224,9 @@ def check_directionality(hypothesis: str) -> Tuple[float, List[str]]:
     score = 0.0
     feedback = []
     
-    hypothesis_lower = hypothesis.lower()
-    
     # Look for directional predictions
-    positive_direction = [
-        'increase', 'improve', 'boost', 'enhance', 'raise', 'lift',
-        'higher', 'more', 'better', 'faster', 'easier'
-    ]
-    
-    negative_direction = [
-        'decrease', 'reduce', 'lower', 'less', 'fewer', 'minimize'
-    ]
-    
-    pos_found = sum(1 for word in positive_direction if word in hypothesis_lower)
-    neg_found = sum(1 for word in negative_direction if word in hypothesis_lower)
+    pos_found = len(hits['positive_direction'])
+    neg_found = len(hits['negative_direction'])
     
     if pos_found > 0 and neg_found == 0:
         score += 2.5
@@ -153,17 +238,17 @@ def check_directionality(hypothesis: str) -> Tuple[float, List[str]]:
         score += 1.0
         feedback.append("⚠ Mixed directional predictions (may be confusing)")
     else:
-        feedback.append("✗ No clear directional prediction")
+        feedback.append(NO_DIRECTION)
     
     return min(score, 2.5), feedback
 
 
-def check_rationale(hypothesis: str) -> Tuple[float, List[str]]:
+def check_rationale(hits: KeywordHits) -> Tuple[float, List[str]]:
     """
     Check hypothesis rationale - contains reasoning.
     
     Args:
-        hypothesis: The hypothesis text
+        hits: Keyword hits from extract_keyword_hits
     
     Returns:
         Tuple of (score, feedback)
@@ -171,28 +256,16 @@ def check_rationale(hypothesis: str) -> Tuple[float, List[str]]:
     score = 0.0
     feedback = []
     
-    hypothesis_lower = hypothesis.lower()
-    
     # Look for reasoning words
-    reasoning_words = [
-        'because', 'since', 'due to', 'as a result', 'therefore',
-        'given that', 'considering', 'based on', 'according to'
-    ]
-    
-    reasoning_found = sum(1 for word in reasoning_words if word in hypothesis_lower)
+    reasoning_found = len(hits['reasoning_words'])
     if reasoning_found > 0:
         score += 1.5
         feedback.append(f"✓ Contains reasoning ({reasoning_found} indicators)")
     else:
-        feedback.append("✗ No clear reasoning provided")
+        feedback.append(NO_REASONING)
     
     # Look for supporting evidence or data
-    evidence_words = [
-        'data', 'research', 'study', 'analysis', 'findings', 'results',
-        'evidence', 'insights', 'observations', 'feedback', 'user behavior'
-    ]
-    
-    evidence_found = sum(1 for word in evidence_words if word in hypothesis_lower)
+    evidence_found = len(hits['evidence_words'])
     if evidence_found > 0:
         score += 1.0
         feedback.append(f"✓ References supporting evidence ({evidence_found} found)")
@@ -202,34 +275,34 @@ def check_rationale(hypothesis: str) -> Tuple[float, List[str]]:
     return min(score, 2.5), feedback
 
 
-def detect_vague_language(hypothesis: str) -> List[str]:
+def detect_vague_language(hits: KeywordHits) -> List[str]:
     """
     Detect vague language in hypothesis.
     
     Args:
-        hypothesis: The hypothesis text
+        hits: Keyword hits from extract_keyword_hits
     
     Returns:
         List of vague words found
     """
-    vague_words = [
-        'improve', 'better', 'optimize', 'enhance', 'good', 'bad',
-        'nice', 'great', 'awesome', 'terrible', 'amazing', 'wonderful'
-    ]
-    
-    hypothesis_lower = hypothesis.lower()
-    found_vague = [word for word in vague_words if word in hypothesis_lower]
+    # Report in vocabulary order so the feedback text is stable
+    found_vague = [word for word in VAGUE_WORDS if word in hits['vague_words']]
     
     return found_vague
 
 
-def generate_improved_hypothesis(hypothesis: str, feedback: List[str]) -> str:
+def generate_improved_hypothesis(
+    hypothesis: str,
+    feedback: AbstractSet[str],
+    vague_words: List[str]
+) -> str:
     """
     Generate an improved hypothesis based on feedback.
     
     Args:
         hypothesis: Original hypothesis
-        feedback: List of feedback items
+        feedback: Set of feedback items
+        vague_words: Vague words found by detect_vague_language
     
     Returns:
         Improved hypothesis suggestion
@@ -237,23 +310,22 @@ def generate_improved_hypothesis(hypothesis: str, feedback: List[str]) -> str:
     improvements = []
     
     # Check for missing elements and suggest improvements
-    if "No specific UI elements mentioned" in feedback:
+    if NO_UI_ELEMENTS in feedback:
         improvements.append("Specify which UI element you're testing (e.g., 'checkout button', 'signup form')")
     
-    if "No specific user actions mentioned" in feedback:
+    if NO_USER_ACTIONS in feedback:
         improvements.append("Specify the user action you expect to change (e.g., 'click rate', 'completion rate')")
     
-    if "No quantitative metrics mentioned" in feedback:
+    if NO_QUANTITATIVE_METRICS in feedback:
         improvements.append("Include specific metrics (e.g., 'conversion rate', 'click-through rate')")
     
-    if "No clear directional prediction" in feedback:
+    if NO_DIRECTION in feedback:
         improvements.append("State whether you expect an increase or decrease in the metric")
     
-    if "No clear reasoning provided" in feedback:
+    if NO_REASONING in feedback:
         improvements.append("Add reasoning with 'because' to explain why you expect this change")
     
     # Check for vague language
-    vague_words = detect_vague_language(hypothesis)
     if vague_words:
         improvements.append(f"Replace vague words like '{', '.join(vague_words)}' with specific, measurable terms")
     
@@ -273,31 +345,49 @@ def score_hypothesis(proposal: TestProposal) -> HypothesisScore:
     Returns:
         HypothesisScore object with detailed scoring and feedback
     """
-    hypothesis = proposal.hypothesis
+    return _score_hypothesis_cached(proposal.hypothesis)
+
+
+@lru_cache(maxsize=1024)
+def _score_hypothesis_cached(hypothesis: str) -> HypothesisScore:
+    """
+    Score a hypothesis string, memoized on the text.
+    
+    Scoring depends only on the hypothesis, so re-analyzing the same proposal
+    (e.g. while tuning traffic or MDE) reuses the previous result.
+    
+    Args:
+        hypothesis: The hypothesis text
+    
+    Returns:
+        HypothesisScore object with detailed scoring and feedback
+    """
+    hits = extract_keyword_hits(hypothesis.lower())
     
     # Score each dimension
-    specificity_score, specificity_feedback = check_specificity(hypothesis)
-    measurability_score, measurability_feedback = check_measurability(hypothesis)
-    directionality_score, directionality_feedback = check_directionality(hypothesis)
-    rationale_score, rationale_feedback = check_rationale(hypothesis)
+    specificity_score, specificity_feedback = check_specificity(hits)
+    measurability_score, measurability_feedback = check_measurability(hits)
+    directionality_score, directionality_feedback = check_directionality(hits)
+    rationale_score, rationale_feedback = check_rationale(hits)
     
     # Calculate overall score
     overall_score = specificity_score + measurability_score + directionality_score + rationale_score
     
     # Combine all feedback
-    all_feedback = []
-    all_feedback.extend(specificity_feedback)
-    all_feedback.extend(measurability_feedback)
-    all_feedback.extend(directionality_feedback)
-    all_feedback.extend(rationale_feedback)
+    all_feedback = [
+        *specificity_feedback,
+        *measurability_feedback,
+        *directionality_feedback,
+        *rationale_feedback
+    ]
     
     # Add vague language detection
-    vague_words = detect_vague_language(hypothesis)
+    vague_words = detect_vague_language(hits)
     if vague_words:
         all_feedback.append(f"⚠ Vague language detected: {', '.join(vague_words)}")
     
     # Generate improved hypothesis
-    improved_hypothesis = generate_improved_hypothesis(hypothesis, all_feedback)
+    improved_hypothesis = generate_improved_hypothesis(hypothesis, set(all_feedback), vague_words)
     
     return HypothesisScore(
         overall_score=overall_score,
@@ -305,7 +395,7 @@ def score_hypothesis(proposal: TestProposal) -> HypothesisScore:
         measurability_score=measurability_score,
         directionality_score=directionality_score,
         rationale_score=rationale_score,
-        feedback=all_feedback,
+        feedback=tuple(all_feedback),
         improved_hypothesis=improved_hypothesis
     )
 
@@ -7,8 +7,8 @@ output formatting, and type safety throughout the application.
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ReadinessStatus(str, Enum):
@@ -27,25 +27,30 @@ class TestProposal(BaseModel):
     daily_traffic: int = Field(..., gt=0, description="Daily traffic volume")
     number_of_variations: int = Field(default=1, ge=1, description="Number of test variations")
     primary_metric: str = Field(..., min_length=1, description="Primary success metric")
-    secondary_metrics: Optional[List[str]] = Field(default=None, description="Secondary metrics to track")
+    secondary_metrics: Optional[Tuple[str, ...]] = Field(default=None, description="Secondary metrics to track")
     test_start_date: Optional[datetime] = Field(default=None, description="Planned test start date")
     
-    @validator('hypothesis')
-    def hypothesis_must_not_be_empty(cls, v):
+    # Frozen (and therefore hashable) so proposals can key caches directly
+    model_config = ConfigDict(frozen=True)
+    
+    @field_validator('hypothesis')
+    @classmethod
+    def hypothesis_must_not_be_empty(cls, v: str) -> str:
         """Validate that hypothesis is not just whitespace."""
         if not v.strip():
             raise ValueError('Hypothesis cannot be empty or just whitespace')
         return v.strip()
     
-    @validator('secondary_metrics')
-    def secondary_metrics_validation(cls, v):
+    @field_validator('secondary_metrics')
+    @classmethod
+    def secondary_metrics_validation(cls, v: Optional[Tuple[str, ...]]) -> Optional[Tuple[str, ...]]:
         """Validate secondary metrics if provided."""
         if v is not None:
             if len(v) == 0:
                 return None
-            # Remove empty strings and duplicates
+            # Remove empty strings and duplicates, keeping first-seen order
             v = [metric.strip() for metric in v if metric.strip()]
-            return list(set(v)) if v else None
+            return tuple(dict.fromkeys(v)) or None
         return v
 
 
@@ -58,6 +63,8 @@ class StatisticalAnalysis(BaseModel):
     confidence_level: float = Field(..., description="Statistical confidence level")
     statistical_power: float = Field(..., description="Statistical power")
     warnings: List[str] = Field(default_factory=list, description="Statistical warnings")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class HypothesisScore(BaseModel):
@@ -68,8 +75,12 @@ class HypothesisScore(BaseModel):
     measurability_score: float = Field(..., ge=0.0, le=2.5, description="Measurability score (0-2.5)")
     directionality_score: float = Field(..., ge=0.0, le=2.5, description="Directionality score (0-2.5)")
     rationale_score: float = Field(..., ge=0.0, le=2.5, description="Rationale score (0-2.5)")
-    feedback: List[str] = Field(default_factory=list, description="Detailed feedback")
+    feedback: Tuple[str, ...] = Field(default=(), description="Detailed feedback")
     improved_hypothesis: Optional[str] = Field(default=None, description="Suggested improved hypothesis")
+    
+    # Instances are memoized by score_hypothesis and shared between requests,
+    # so fields hold immutable values (feedback is a tuple, not a list)
+    model_config = ConfigDict(frozen=True)
 
 
 class DesignAnalysis(BaseModel):
@@ -79,6 +90,8 @@ class DesignAnalysis(BaseModel):
     traffic_allocation_warning: Optional[str] = Field(default=None, description="Warning about traffic allocation")
     metric_warnings: List[str] = Field(default_factory=list, description="Metric-specific warnings")
     recommendations: List[str] = Field(default_factory=list, description="Design recommendations")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class AnalysisResult(BaseModel):
@@ -90,9 +103,7 @@ class AnalysisResult(BaseModel):
     design_analysis: DesignAnalysis = Field(..., description="Design validation results")
     overall_recommendations: List[str] = Field(default_factory=list, description="Overall recommendations")
     
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
 
 
 
@@ -6,12 +6,96 @@ including sample size calculations, duration estimates, and power analysis.
 """
 
 import math
-from typing import List
-from scipy.stats import norm
+from functools import lru_cache
+from typing import Final, Tuple
+
+import numpy as np
 
 from .models import TestProposal, StatisticalAnalysis
 
 
+# z-scores for the default significance level (alpha=0.05, two-sided) and power (0.8)
+Z_ALPHA_05 = 1.959963984540054
+Z_BETA_08 = 0.8416212335729143
+
+
+# Warning thresholds
+LONG_TEST_DAYS: Final = 60
+MEDIUM_TEST_DAYS: Final = 30
+MIN_MDE: Final = 0.01
+MAX_MDE: Final = 0.5
+LOW_BASELINE: Final = 0.01
+MAX_VARIATIONS: Final = 4
+
+# Warning message templates, called with the values they report
+_WARN_LONG = (
+    "Test duration is {} days, which may be too long. "
+    "Consider increasing traffic or reducing MDE."
+).format
+_WARN_MEDIUM = (
+    "Test duration is {} days. "
+    "Consider if this timeline is acceptable for your business."
+).format
+_WARN_SMALL_MDE = (
+    "Very small MDE detected. This may require very large sample sizes "
+    "and long test durations."
+).format
+_WARN_LARGE_MDE = (
+    "Large MDE detected. This may indicate unrealistic expectations "
+    "for the test impact."
+).format
+_WARN_LOW_BASELINE = (
+    "Very low baseline conversion rate. Consider if the metric is "
+    "appropriate for testing."
+).format
+_WARN_VARIATIONS = (
+    "Testing {} variations may dilute "
+    "traffic and reduce statistical power."
+).format
+_WARN_TRAFFIC = (
+    "Daily traffic ({}) is insufficient for "
+    "required sample rate ({} samples/day)."
+).format
+
+
+@lru_cache(maxsize=64)
+def _z(p: float) -> float:
+    """
+    Inverse standard normal CDF, memoized for non-default alpha/power.
+    
+    scipy is imported on first use rather than at module load, so processes
+    that only use the default z-scores never load it.
+    """
+    from scipy.special import ndtri
+    return float(ndtri(p))
+
+
+def _z_scores(power: float, alpha: float) -> Tuple[float, float]:
+    """Return (z_alpha, z_beta) for a two-sided test; the defaults skip scipy entirely."""
+    if alpha == 0.05 and power == 0.8:
+        return Z_ALPHA_05, Z_BETA_08
+    return _z(1 - alpha / 2), _z(power)
+
+
+def _sample_size_kernel(p1: float, mde: float, z_alpha: float, z_beta: float) -> int:
+    """
+    Scalar sample-size formula for a two-sample proportion test.
+    
+    Shared by calculate_sample_size and, compiled by numba, by
+    calculate_sample_size_batch.
+    """
+    # Ensure p2 doesn't exceed 1
+    p2 = min(p1 + mde, 1.0)
+    
+    # Pooled proportion for variance calculation
+    p_pooled = (p1 + p2) / 2
+    
+    # Calculate sample size using two-sample proportion test formula
+    numerator = (z_alpha + z_beta) ** 2 * 2 * p_pooled * (1 - p_pooled)
+    
+    return max(math.ceil(numerator / mde ** 2), 100)  # Minimum sample size of 100
+
+
 def calculate_sample_size(
     baseline_rate: float,
     mde: float,
@@ -30,27 +114,69 @@ def calculate_sample_size(
     Returns:
         Required sample size per variation
     """
-    # Calculate z-scores
-    z_alpha = norm.ppf(1 - alpha / 2)
-    z_beta = norm.ppf(power)
+    return _sample_size_kernel(baseline_rate, mde, *_z_scores(power, alpha))
+
+
+@lru_cache(maxsize=None)
+def _sample_size_ufunc():
+    """
+    Compile _sample_size_kernel into a numba ufunc on first use.
     
-    # Calculate pooled proportion
-    p1 = baseline_rate
-    p2 = baseline_rate + mde
+    The ufunc runs one fused loop over the broadcast grid with no temporary
+    arrays. fastmath is left off so results stay identical to
+    calculate_sample_size. numba is optional and imported lazily, so the API
+    process never pays for it.
     
-    # Ensure p2 doesn't exceed 1
-    p2 = min(p2, 1.0)
+    Returns:
+        Compiled ufunc, or None if numba is not installed
+    """
+    try:
+        from numba import vectorize
+    except ImportError:
+        return None
+    signature = "int64(float64, float64, float64, float64)"
+    return vectorize([signature], cache=True)(_sample_size_kernel)
+
+
+def calculate_sample_size_batch(
+    baseline_rate: np.ndarray,
+    mde: np.ndarray,
+    power: float = 0.8,
+    alpha: float = 0.05
+) -> np.ndarray:
+    """
+    Vectorized calculate_sample_size for parameter sweeps.
     
-    # Pooled proportion for variance calculation
-    p_pooled = (p1 + p2) / 2
+    baseline_rate and mde are broadcast against each other, so a column of
+    baselines and a row of MDEs yields a full sensitivity grid in one call,
+    with the z-scores looked up once. Uses a numba-compiled kernel when numba
+    is installed. Results match calculate_sample_size element for element.
     
-    # Calculate sample size using two-sample proportion test formula
-    numerator = (z_alpha + z_beta) ** 2 * 2 * p_pooled * (1 - p_pooled)
-    denominator = mde ** 2
+    Args:
+        baseline_rate: Baseline conversion rates (0-1)
+        mde: Minimum detectable effects (0-1], must be non-zero
+        power: Statistical power (default 0.8)
+        alpha: Significance level (default 0.05)
+    
+    Returns:
+        Array of required sample sizes per variation (int64)
+    """
+    z_alpha, z_beta = _z_scores(power, alpha)
     
-    sample_size = math.ceil(numerator / denominator)
+    compiled_kernel = _sample_size_ufunc()
+    if compiled_kernel is not None:
+        return compiled_kernel(baseline_rate, mde, z_alpha, z_beta)
     
-    return max(sample_size, 100)  # Minimum sample size of 100
+    p1 = np.asarray(baseline_rate, dtype=np.float64)
+    mde = np.asarray(mde, dtype=np.float64)
+    
+    # Same formula as calculate_sample_size, applied elementwise
+    p2 = np.minimum(p1 + mde, 1.0)
+    p_pooled = (p1 + p2) / 2
+    numerator = (z_alpha + z_beta) ** 2 * 2 * p_pooled * (1 - p_pooled)
+    sample_size = np.ceil(numerator / mde ** 2).astype(np.int64)
+    
+    return np.maximum(sample_size, 100)  # Minimum sample size of 100
 
 
 def estimate_duration(
@@ -88,12 +214,50 @@ def analyze_statistical_validity(proposal: TestProposal) -> StatisticalAnalysis:
     Returns:
         StatisticalAnalysis object with results and warnings
     """
-    warnings: List[str] = []
+    required_sample_size, estimated_duration, samples_per_day, warnings = _analyze_core(
+        baseline_rate=proposal.baseline_conversion_rate,
+        mde=proposal.minimum_detectable_effect,
+        daily_traffic=proposal.daily_traffic,
+        number_of_variations=proposal.number_of_variations
+    )
+    
+    # Values are computed here and already valid, so skip re-validation
+    return StatisticalAnalysis.model_construct(
+        required_sample_size=required_sample_size,
+        estimated_duration_days=estimated_duration,
+        samples_per_day_needed=samples_per_day,
+        confidence_level=0.95,
+        statistical_power=0.8,
+        warnings=list(warnings)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _analyze_core(
+    baseline_rate: float,
+    mde: float,
+    daily_traffic: int,
+    number_of_variations: int
+) -> Tuple[int, int, int, Tuple[str, ...]]:
+    """
+    Compute the statistical analysis, memoized on the numeric inputs.
+    
+    Only these four proposal fields affect the result, so proposals that
+    differ elsewhere (hypothesis, metrics, dates) share cache entries.
     
+    Args:
+        baseline_rate: Baseline conversion rate (0-1)
+        mde: Minimum detectable effect (0-1)
+        daily_traffic: Daily traffic volume
+        number_of_variations: Number of test variations
+    
+    Returns:
+        Tuple of (required_sample_size, estimated_duration, samples_per_day, warnings)
+    """
     # Calculate required sample size
     required_sample_size = calculate_sample_size(
-        baseline_rate=proposal.baseline_conversion_rate,
-        mde=proposal.minimum_detectable_effect,
+        baseline_rate=baseline_rate,
+        mde=mde,
         power=0.8,
         alpha=0.05
     )
@@ -101,65 +265,25 @@ def analyze_statistical_validity(proposal: TestProposal) -> StatisticalAnalysis:
     # Estimate duration
     estimated_duration = estimate_duration(
         required_sample_size=required_sample_size,
-        daily_traffic=proposal.daily_traffic,
-        number_of_variations=proposal.number_of_variations
+        daily_traffic=daily_traffic,
+        number_of_variations=number_of_variations
     )
     
     # Calculate samples per day needed
-    total_samples_needed = required_sample_size * proposal.number_of_variations
+    total_samples_needed = required_sample_size * number_of_variations
     samples_per_day = math.ceil(total_samples_needed / estimated_duration)
     
-    # Generate warnings based on analysis
-    if estimated_duration > 60:
-        warnings.append(
-            f"Test duration is {estimated_duration} days, which may be too long. "
-            "Consider increasing traffic or reducing MDE."
-        )
-    elif estimated_duration > 30:
-        warnings.append(
-            f"Test duration is {estimated_duration} days. "
-            "Consider if this timeline is acceptable for your business."
-        )
-    
-    if proposal.minimum_detectable_effect < 0.01:
-        warnings.append(
-            "Very small MDE detected. This may require very large sample sizes "
-            "and long test durations."
-        )
-    elif proposal.minimum_detectable_effect > 0.5:
-        warnings.append(
-            "Large MDE detected. This may indicate unrealistic expectations "
-            "for the test impact."
-        )
-    
-    if proposal.baseline_conversion_rate < 0.01:
-        warnings.append(
-            "Very low baseline conversion rate. Consider if the metric is "
-            "appropriate for testing."
-        )
-    
-    if proposal.number_of_variations > 4:
-        warnings.append(
-            f"Testing {proposal.number_of_variations} variations may dilute "
-            "traffic and reduce statistical power."
-        )
-    
-    # Check if daily traffic is sufficient
-    if samples_per_day > proposal.daily_traffic:
-        warnings.append(
-            f"Daily traffic ({proposal.daily_traffic}) is insufficient for "
-            f"required sample rate ({samples_per_day} samples/day)."
-        )
-    
-    return StatisticalAnalysis(
-        required_sample_size=required_sample_size,
-        estimated_duration_days=estimated_duration,
-        samples_per_day_needed=samples_per_day,
-        confidence_level=0.95,
-        statistical_power=0.8,
-        warnings=warnings
+    # Warning rules: (condition, message template, template arguments)
+    rules = (
+        (estimated_duration > LONG_TEST_DAYS, _WARN_LONG, (estimated_duration,)),
+        (MEDIUM_TEST_DAYS < estimated_duration <= LONG_TEST_DAYS, _WARN_MEDIUM, (estimated_duration,)),
+        (mde < MIN_MDE, _WARN_SMALL_MDE, ()),
+        (mde > MAX_MDE, _WARN_LARGE_MDE, ()),
+        (baseline_rate < LOW_BASELINE, _WARN_LOW_BASELINE, ()),
+        (number_of_variations > MAX_VARIATIONS, _WARN_VARIATIONS, (number_of_variations,)),
+        # Check if daily traffic is sufficient
+        (samples_per_day > daily_traffic, _WARN_TRAFFIC, (daily_traffic, samples_per_day)),
     )
-
-
-
-
+    warnings = [message(*args) for matched, message, args in rules if matched]
+    
+    return required_sample_size, estimated_duration, samples_per_day, tuple(warnings)
@@ -0,0 +1,57 @@
+"""
+Tests for hypothesis quality scoring.
+"""
+
+import unittest
+
+from core.hypothesis import score_hypothesis
+from core.models import TestProposal
+
+
+def make_proposal(hypothesis: str) -> TestProposal:
+    """Build a proposal around a hypothesis; only the hypothesis affects scoring."""
+    return TestProposal(
+        hypothesis=hypothesis,
+        baseline_conversion_rate=0.1,
+        minimum_detectable_effect=0.1,
+        daily_traffic=1000,
+        primary_metric="conversion_rate"
+    )
+
+
+class ImprovedHypothesisTest(unittest.TestCase):
+    """Regression tests for the improved_hypothesis suggestions."""
+
+    def test_suggests_every_missing_element(self):
+        result = score_hypothesis(make_proposal("Making the page nicer will be great"))
+
+        self.assertEqual(
+            result.improved_hypothesis,
+            "Consider these improvements:\n"
+            "• Specify which UI element you're testing (e.g., 'checkout button', 'signup form')\n"
+            "• Specify the user action you expect to change (e.g., 'click rate', 'completion rate')\n"
+            "• Include specific metrics (e.g., 'conversion rate', 'click-through rate')\n"
+            "• State whether you expect an increase or decrease in the metric\n"
+            "• Add reasoning with 'because' to explain why you expect this change\n"
+            "• Replace vague words like 'nice, great' with specific, measurable terms"
+        )
+
+    def test_only_suggests_missing_elements(self):
+        result = score_hypothesis(make_proposal(
+            "Changing the checkout button color will increase the click rate because "
+            "users notice it"
+        ))
+
+        self.assertEqual(
+            result.improved_hypothesis,
+            "Hypothesis is already well-structured. Consider adding more specific details if possible."
+        )
+
+    def test_feedback_is_immutable(self):
+        result = score_hypothesis(make_proposal("Making the page nicer will be great"))
+
+        self.assertIsInstance(result.feedback, tuple)
+
+
+if __name__ == "__main__":
+    unittest.main()
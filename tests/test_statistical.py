@@ -0,0 +1,46 @@
+"""
+Tests for the statistical analysis module.
+"""
+
+import importlib.util
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from core import statistical
+from core.statistical import calculate_sample_size, calculate_sample_size_batch
+
+# Baselines and MDEs covering tiny effects, the minimum sample size and p2 capped at 1
+BASELINE_RATES = np.array([0.0, 0.001, 0.01, 0.05, 0.15, 0.5, 0.9, 0.99, 1.0])
+MDES = np.array([0.0005, 0.001, 0.01, 0.02, 0.05, 0.1, 0.3, 0.5, 1.0])
+
+# (power, alpha) pairs: the precomputed defaults and computed z-scores
+Z_SETTINGS = [(0.8, 0.05), (0.9, 0.01), (0.95, 0.1)]
+
+
+class SampleSizeBatchTest(unittest.TestCase):
+    """calculate_sample_size_batch must agree with calculate_sample_size."""
+
+    def assert_matches_scalar(self):
+        for power, alpha in Z_SETTINGS:
+            grid = calculate_sample_size_batch(BASELINE_RATES[:, None], MDES[None, :], power, alpha)
+            expected = [
+                [calculate_sample_size(baseline, mde, power, alpha) for mde in MDES]
+                for baseline in BASELINE_RATES
+            ]
+            self.assertEqual(grid.dtype, np.int64)
+            self.assertEqual(grid.tolist(), expected, f"power={power}, alpha={alpha}")
+
+    @unittest.skipUnless(importlib.util.find_spec("numba"), "numba is not installed")
+    def test_numba_kernel_matches_scalar(self):
+        self.assertIsNotNone(statistical._sample_size_ufunc())
+        self.assert_matches_scalar()
+
+    def test_numpy_fallback_matches_scalar(self):
+        with mock.patch.object(statistical, "_sample_size_ufunc", return_value=None):
+            self.assert_matches_scalar()
+
+
+if __name__ == "__main__":
+    unittest.main()